@@ -1,64 +1,102 @@
 """Streamlit dashboard for visualizing trending products."""
 from __future__ import annotations
 
+import io
+import json
 import logging
-from datetime import date
-from typing import List, Optional
+import os
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
 
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from database import DB_PATH, get_conn, init_db, update_status
+from database import (
+    DB_PATH,
+    fetch_metrics_for_products,
+    fetch_platforms,
+    get_conn,
+    init_db,
+    update_status,
+)
 from scheduler import run_once
 
 logging.basicConfig(level=logging.INFO)
 
 STATUS_OPTIONS = ["new", "researching", "ordered samples", "testing", "live", "pass", "saturated"]
-
-
-@st.cache_data(show_spinner=False)
+METRIC_COLUMNS = ["reviews", "orders", "price"]
+HISTORY_COLUMNS = ["product_id", "date", *METRIC_COLUMNS]
+HISTORY_LIMIT = 25
+LOG_TAIL_BYTES = 4000
+CSV_CHUNK_ROWS = 10_000
+EXPORT_COLUMNS = ["name", "trend_score", "category", "status", "first_seen", "last_updated",
+                  "platforms", "source_urls", "notes"]
+CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+# ``last_run`` is only part of the cache key so results refresh after a scrape.
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL_SECONDS)
 def load_products(start_date: Optional[date] = None, end_date: Optional[date] = None,
                  platforms: Optional[List[str]] = None,
-                 min_score: float = 0.0) -> pd.DataFrame:
+                 min_score: float = 0.0, last_run: Optional[str] = None) -> pd.DataFrame:
     with get_conn(DB_PATH) as conn:
         query = (
             """
             SELECT p.id, p.name, p.category, p.first_seen, p.last_updated, p.trend_score,
                    p.image_url, p.status, p.notes,
-                   GROUP_CONCAT(DISTINCT s.platform) AS platforms,
-                   GROUP_CONCAT(DISTINCT s.url) AS source_urls
+                   json_group_array(DISTINCT s.platform) FILTER (WHERE s.platform IS NOT NULL) AS platforms,
+                   json_group_array(DISTINCT s.url) FILTER (WHERE s.url IS NOT NULL) AS source_urls
             FROM products p
             LEFT JOIN sources s ON s.product_id = p.id
-            GROUP BY p.id
-            HAVING trend_score >= ?
+            WHERE p.trend_score >= ?
             """
         )
         params: List[object] = [min_score]
-        if platforms:
-            query += " AND (" + " OR ".join("platforms LIKE ?" for _ in platforms) + ")"
-            params.extend([f"%{platform}%" for platform in platforms])
+        # Compare raw ISO timestamps so SQLite can use the products indexes.
         if start_date:
-            query += " AND date(first_seen) >= ?"
+            query += " AND p.first_seen >= ?"
             params.append(start_date.isoformat())
         if end_date:
-            query += " AND date(last_updated) <= ?"
-            params.append(end_date.isoformat())
-        df = pd.read_sql_query(query, conn, params=params)
-    if not df.empty:
-        df["platform_list"] = df["platforms"].fillna("").apply(lambda x: list(filter(None, x.split(","))))
+            query += " AND p.last_updated < ?"
+            params.append((end_date + timedelta(days=1)).isoformat())
+        if platforms:
+            placeholders = ",".join("?" for _ in platforms)
+            query += (
+                " AND EXISTS (SELECT 1 FROM sources s2"
+                f" WHERE s2.product_id = p.id AND s2.platform IN ({placeholders}))"
+            )
+            params.extend(platforms)
+        query += " GROUP BY p.id ORDER BY p.trend_score DESC"
+        df = pd.read_sql_query(query, conn, params=params, parse_dates=["first_seen", "last_updated"])
+    df["platforms"] = df["platforms"].map(json.loads)
+    df["source_urls"] = df["source_urls"].map(json.loads)
     return df
 
 
-def load_metrics(product_id: int) -> pd.DataFrame:
-    with get_conn(DB_PATH) as conn:
-        df = pd.read_sql_query(
-            "SELECT date, reviews, orders, price FROM metrics WHERE product_id = ? ORDER BY date ASC",
-            conn,
-            params=[product_id],
-        )
-    return df
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL_SECONDS)
+def load_metric_histories(product_ids: Sequence[int],
+                          last_run: Optional[str] = None) -> Dict[int, pd.DataFrame]:
+    histories = fetch_metrics_for_products(product_ids, limit_per=HISTORY_LIMIT, path=DB_PATH)
+    frame = pd.DataFrame.from_records(
+        [row for rows in histories.values() for row in rows], columns=HISTORY_COLUMNS
+    )
+    frame["date"] = pd.to_datetime(frame["date"], errors="coerce")
+    return {product_id: group for product_id, group in frame.groupby("product_id")}
+
+
+@st.cache_data(show_spinner=False, ttl=300)
+def load_platforms(last_run: Optional[str] = None) -> List[str]:
+    return fetch_platforms(DB_PATH)
+
+
+# ``mtime`` is only part of the cache key so the tail refreshes when the log changes.
+@st.cache_data(show_spinner=False, ttl=30)
+def load_log_tail(path: str, mtime: float, size: int = LOG_TAIL_BYTES) -> str:
+    with open(path, "rb") as handle:
+        handle.seek(max(0, os.fstat(handle.fileno()).st_size - size))
+        return handle.read().decode("utf-8", errors="replace")
 
 
 def render_gauge(score: float) -> go.Figure:
@@ -71,26 +109,23 @@ def render_gauge(score: float) -> go.Figure:
     return fig
 
 
-def render_product_card(row: pd.Series) -> None:
+def render_product_card(row: Any, history: pd.DataFrame) -> None:
     st.markdown("---")
     cols = st.columns([1, 3])
     if row.image_url:
         cols[0].image(row.image_url, use_column_width=True)
     cols[1].markdown(f"### {row.name}")
     cols[1].plotly_chart(render_gauge(row.trend_score), use_container_width=True)
-    platforms = row.get("platform_list", [])
+    platforms = row.platforms
     badge_text = " ".join(f"`{platform}`" for platform in platforms)
     cols[1].markdown(f"Platforms: {badge_text or 'N/A'}")
-    if row.source_urls:
-        for url in set(row.source_urls.split(",")):
-            cols[1].markdown(f"[Source Link]({url})")
+    for url in row.source_urls:
+        cols[1].markdown(f"[Source Link]({url})")
     with st.expander("Trend Metrics"):
-        metrics_df = load_metrics(row.id)
-        if metrics_df.empty:
+        if not history[METRIC_COLUMNS].notna().to_numpy().any():
             st.info("No metrics captured yet.")
         else:
-            metrics_df["date"] = pd.to_datetime(metrics_df["date"])
-            fig = px.line(metrics_df, x="date", y=["reviews", "orders", "price"], markers=True)
+            fig = px.line(history, x="date", y=METRIC_COLUMNS, markers=True)
             st.plotly_chart(fig, use_container_width=True)
     with st.expander("Notes & Status"):
         default_index = STATUS_OPTIONS.index(row.status) if row.status in STATUS_OPTIONS else 0
@@ -98,46 +133,84 @@ def render_product_card(row: pd.Series) -> None:
         notes = st.text_area("Notes", value=row.notes or "", key=f"notes_{row.id}")
         if st.button("Save", key=f"save_{row.id}"):
             update_status(row.id, status, notes)
-            st.success("Updated status")
-            st.cache_data.clear()
+            load_products.clear()
+            export_csv.clear()
+            st.session_state["flash"] = "Updated status"
+            st.rerun()
 
 
 def render_table(df: pd.DataFrame) -> None:
     table_df = df[["name", "trend_score", "category", "status", "first_seen", "last_updated", "platforms"]]
-    st.dataframe(table_df.sort_values(by="trend_score", ascending=False), use_container_width=True)
+    st.dataframe(table_df, use_container_width=True)
+
+
+def build_csv(df: pd.DataFrame) -> io.BytesIO:
+    export_df = df[EXPORT_COLUMNS].assign(
+        platforms=df["platforms"].str.join(","),
+        source_urls=df["source_urls"].str.join(","),
+    )
+    # Encode straight into a binary buffer in chunks rather than building a str first.
+    buffer = io.BytesIO()
+    export_df.to_csv(buffer, index=False, encoding="utf-8", chunksize=CSV_CHUNK_ROWS)
+    buffer.seek(0)
+    return buffer
+
+
+# Cached on the same filters as ``load_products`` so reruns reuse the encoded file. The buffer
+# itself goes to st.download_button; calling getvalue() here would hold a second copy.
+@st.cache_data(show_spinner=False, ttl=CACHE_TTL_SECONDS)
+def export_csv(start_date: Optional[date] = None, end_date: Optional[date] = None,
+               platforms: Optional[List[str]] = None,
+               min_score: float = 0.0, last_run: Optional[str] = None) -> io.BytesIO:
+    df = load_products(start_date=start_date, end_date=end_date, platforms=platforms,
+                       min_score=min_score, last_run=last_run)
+    return build_csv(df)
 
 
 def main() -> None:
     st.set_page_config(page_title="Trending Product Radar", layout="wide")
     st.title("Trending Product Radar")
     init_db()
+    flash = st.session_state.pop("flash", None)
+    if flash:
+        st.success(flash)
 
     with st.sidebar:
         st.header("Scraper Controls")
         if st.button("Run Scrapers Now"):
             with st.spinner("Scraping..."):
                 run_once()
-                st.cache_data.clear()
+                st.session_state["last_run"] = datetime.utcnow().isoformat()
+                load_products.clear()
+                export_csv.clear()
+                load_metric_histories.clear()
                 st.success("Scrape completed")
         st.write(f"Database: {DB_PATH}")
+        last_run = st.session_state.get("last_run")
 
         st.header("Filters")
         min_score = st.slider("Minimum Trend Score", 0, 100, value=50)
         start_date = st.date_input("Start Date", value=None)
         end_date = st.date_input("End Date", value=None)
-        selected_platforms = st.multiselect("Platforms", ["amazon", "aliexpress", "reddit"])
+        selected_platforms = st.multiselect("Platforms", load_platforms(last_run=last_run))
 
-    df = load_products(start_date=start_date or None, end_date=end_date or None,
-                       platforms=selected_platforms or None, min_score=float(min_score))
+    filters = dict(start_date=start_date or None, end_date=end_date or None,
+                   platforms=selected_platforms or None, min_score=float(min_score),
+                   last_run=last_run)
+    df = load_products(**filters)
 
     st.subheader("Ranked Trending Products")
     if df.empty:
         st.info("No products available yet. Trigger a scrape to populate data.")
     else:
         render_table(df)
+        st.download_button("Download CSV", data=export_csv(**filters), file_name="trending_products.csv",
+                           mime="text/csv")
         st.subheader("Product Highlights")
-        for _, row in df.iterrows():
-            render_product_card(row)
+        histories = load_metric_histories(tuple(df["id"].tolist()), last_run=last_run)
+        empty_history = pd.DataFrame(columns=HISTORY_COLUMNS)
+        for row in df.itertuples(index=False):
+            render_product_card(row, history=histories.get(row.id, empty_history))
 
     st.subheader("History & Exclusions")
     if not df.empty:
@@ -150,8 +223,8 @@ def main() -> None:
     st.subheader("Error Logs")
     log_path = DB_PATH.parent / "scraper.log"
     if log_path.exists():
-        st.download_button("Download Log", data=log_path.read_text(encoding="utf-8"), file_name="scraper.log")
-        st.text(log_path.read_text(encoding="utf-8")[-4000:])
+        st.download_button("Download Log", data=log_path.read_bytes(), file_name="scraper.log")
+        st.text(load_log_tail(str(log_path), log_path.stat().st_mtime))
     else:
         st.info("No errors logged yet.")
 
@@ -20,6 +20,7 @@ DEFAULT_HEADLESS = os.environ.get("TRENDING_PRODUCTS_HEADLESS", "true").lower()
 PROXY_URL = os.environ.get("TRENDING_PRODUCTS_PROXY")
 PAGE_LOAD_TIMEOUT = int(os.environ.get("TRENDING_PRODUCTS_TIMEOUT", 45))
 IMPLICIT_WAIT = int(os.environ.get("TRENDING_PRODUCTS_IMPLICIT_WAIT", 5))
+BROWSER_POOL_SIZE = max(1, int(os.environ.get("TRENDING_PRODUCTS_BROWSER_POOL", 2)))
 RANDOM_DELAY_RANGE = (float(os.environ.get("TRENDING_PRODUCTS_DELAY_MIN", 2)),
                       float(os.environ.get("TRENDING_PRODUCTS_DELAY_MAX", 5)))
 
@@ -3,11 +3,14 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+import threading
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
 
 from config import DATA_DIR
 from scrapers.base_scraper import ProductRecord
@@ -16,6 +19,10 @@ LOGGER = logging.getLogger(__name__)
 
 DB_PATH = DATA_DIR / "trending_products.sqlite3"
 
+# sqlite3 caches prepared statements keyed by their exact SQL text, so keep every
+# hot-path query in a module constant and size the cache to hold all of them.
+STATEMENT_CACHE_SIZE = 256
+
 
 @dataclass(slots=True)
 class Product:
@@ -30,9 +37,57 @@ class Product:
     notes: Optional[str]
 
 
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA busy_timeout=5000;
+"""
+
+
+def _configure(conn: sqlite3.Connection, path: Path) -> None:
+    """Apply WAL journaling and the connection-level PRAGMAs."""
+
+    # WAL persists in the database file but is cheap to re-assert; in-memory databases cannot use it.
+    if str(path) != ":memory:":
+        conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_CONNECTION_PRAGMAS)
+
+
+# One long-lived connection per database file, shared by every thread in the process. The
+# lock is held for a whole get_conn() block, so a connection is never used by two threads at
+# once and close_connections() cannot close it mid-transaction.
+_CONNECTIONS: Dict[str, sqlite3.Connection] = {}
+_CONNECTIONS_LOCK = threading.RLock()
+
+
+def _connection(path: Path) -> sqlite3.Connection:
+    """Return the process's connection for ``path``, opening it on first use; hold the lock."""
+
+    key = str(path)
+    conn = _CONNECTIONS.get(key)
+    if conn is None:
+        conn = sqlite3.connect(path, cached_statements=STATEMENT_CACHE_SIZE, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        _configure(conn, path)
+        _CONNECTIONS[key] = conn
+        LOGGER.debug("Opened SQLite connection to %s", path)
+    return conn
+
+
+def close_connections() -> None:
+    """Close every cached connection, e.g. when the scheduler shuts down."""
+
+    with _CONNECTIONS_LOCK:
+        for conn in _CONNECTIONS.values():
+            conn.close()
+        _CONNECTIONS.clear()
+
+
 def init_db(path: Path = DB_PATH) -> None:
     LOGGER.info("Initializing database at %s", path)
-    with sqlite3.connect(path) as conn:
+    with get_conn(path) as conn:
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS products (
@@ -75,128 +130,307 @@ def init_db(path: Path = DB_PATH) -> None:
             )
             """
         )
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_products_name ON products(name)")
+        # upsert_product's ON CONFLICT(name) needs a unique index. Merge products first so the
+        # metrics and sources collapse below also folds rows re-pointed at the surviving product.
+        # The oldest row is the one lookups by name always returned, so it survives.
+        if not _index_exists(conn, "idx_products_name_unique"):
+            _fold_duplicate_products(conn)
+        _ensure_unique_index(conn, "idx_products_name_unique", "products", "name",
+                             replaces="idx_products_name", keep="MIN",
+                             references=(("metrics", "product_id"), ("sources", "product_id")))
         conn.execute("CREATE INDEX IF NOT EXISTS idx_sources_platform ON sources(platform)")
+        _ensure_unique_index(conn, "idx_metrics_product_date", "metrics", "product_id, date",
+                             replaces="idx_metrics_product")
+        _ensure_unique_index(conn, "idx_sources_product_url", "sources", "product_id, url")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_products_filter "
+            "ON products(trend_score, first_seen, last_updated)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_products_first_seen ON products(first_seen)")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_sources_product_platform ON sources(product_id, platform)"
+        )
     LOGGER.info("Database initialized")
 
 
-@contextmanager
-def get_conn(path: Path = DB_PATH):
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
-
-
-def upsert_product(record: ProductRecord, *, conn: sqlite3.Connection) -> int:
-    cursor = conn.execute(
-        "SELECT id, trend_score, status FROM products WHERE name = ?",
-        (record.name,),
-    )
-    row = cursor.fetchone()
-    now = datetime.utcnow().isoformat()
-    if row:
-        product_id = row["id"]
-        trend_score = compute_trend_score(record, existing_score=row["trend_score"])
+def _ensure_unique_index(conn: sqlite3.Connection, index: str, table: str, columns: str,
+                         replaces: str | None = None,
+                         references: Sequence[tuple[str, str]] = (), keep: str = "MAX") -> None:
+    """Create a unique index on ``table(columns)``, collapsing duplicate rows first.
+
+    Of each duplicate group the row with the ``keep`` (``MAX`` or ``MIN``) id survives.
+    ``references`` lists ``(child_table, column)`` foreign keys into ``table``; they are moved
+    onto the surviving row before its duplicates are deleted.
+    """
+
+    if _index_exists(conn, index):
+        return
+    # Databases created before the index may hold duplicate rows for the key.
+    stale = f"SELECT id FROM {table} WHERE id NOT IN (SELECT {keep}(id) FROM {table} GROUP BY {columns})"
+    key_columns = [col.strip() for col in columns.split(",")]
+    same_key = " AND ".join(f"keep.{col} = dup.{col}" for col in key_columns)
+    for child, column in references:
         conn.execute(
-            """
-            UPDATE products
-            SET last_updated = ?, trend_score = ?, image_url = COALESCE(?, image_url)
-            WHERE id = ?
-            """,
-            (now, trend_score, record.image_url, product_id),
+            f"UPDATE {child} SET {column} = ("
+            f"SELECT {keep}(keep.id) FROM {table} AS keep JOIN {table} AS dup ON {same_key} "
+            f"WHERE dup.id = {child}.{column}) "
+            f"WHERE {column} IN ({stale})"
         )
-    else:
-        trend_score = compute_trend_score(record)
-        cursor = conn.execute(
-            """
-            INSERT INTO products (name, category, first_seen, last_updated, trend_score, image_url, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                record.name,
-                record.metadata.get("category") if record.metadata else None,
-                now,
-                now,
-                trend_score,
-                record.image_url,
-                "new",
-            ),
-        )
-        product_id = cursor.lastrowid
-    LOGGER.debug("Upserted product %s -> id %s", record.name, product_id)
-    return product_id
+    removed = conn.execute(f"DELETE FROM {table} WHERE id IN ({stale})").rowcount
+    if removed:
+        LOGGER.info("Removed %d duplicate %s rows", removed, table)
+    if replaces:
+        conn.execute(f"DROP INDEX IF EXISTS {replaces}")
+    conn.execute(f"CREATE UNIQUE INDEX {index} ON {table}({columns})")
+
+
+def _index_exists(conn: sqlite3.Connection, index: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index,)
+    ).fetchone() is not None
+
 
+def _fold_duplicate_products(conn: sqlite3.Connection) -> None:
+    """Carry user-entered fields from same-named products onto the oldest row before the merge."""
 
-def add_metric(product_id: int, record: ProductRecord, *, conn: sqlite3.Connection) -> None:
     conn.execute(
         """
-        INSERT INTO metrics (product_id, date, reviews, orders, price, currency, social_mentions)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            product_id,
-            datetime.utcnow().date().isoformat(),
-            record.reviews,
-            record.orders,
-            record.price,
-            record.currency,
-            record.metadata.get("social_mentions") if record.metadata else None,
-        ),
+        UPDATE products SET
+            first_seen = (SELECT MIN(dup.first_seen) FROM products AS dup
+                          WHERE dup.name = products.name),
+            last_updated = (SELECT MAX(dup.last_updated) FROM products AS dup
+                            WHERE dup.name = products.name),
+            trend_score = (SELECT MAX(dup.trend_score) FROM products AS dup
+                           WHERE dup.name = products.name),
+            status = (SELECT dup.status FROM products AS dup WHERE dup.name = products.name
+                      ORDER BY dup.status = 'new', dup.id LIMIT 1),
+            notes = COALESCE((SELECT dup.notes FROM products AS dup
+                              WHERE dup.name = products.name AND COALESCE(dup.notes, '') != ''
+                              ORDER BY dup.id LIMIT 1), notes),
+            category = COALESCE(category, (SELECT dup.category FROM products AS dup
+                                           WHERE dup.name = products.name AND dup.category IS NOT NULL
+                                           ORDER BY dup.id LIMIT 1)),
+            image_url = COALESCE(image_url, (SELECT dup.image_url FROM products AS dup
+                                             WHERE dup.name = products.name AND dup.image_url IS NOT NULL
+                                             ORDER BY dup.id LIMIT 1))
+        WHERE id IN (SELECT MIN(id) FROM products GROUP BY name HAVING COUNT(*) > 1)
+        """
     )
 
 
-def add_source(product_id: int, record: ProductRecord, *, conn: sqlite3.Connection) -> None:
-    conn.execute(
-        """
-        INSERT INTO sources (product_id, platform, url, found_at)
-        VALUES (?, ?, ?, ?)
-        """,
-        (
-            product_id,
-            record.platform,
-            record.url,
-            datetime.utcnow().isoformat(),
-        ),
+@contextmanager
+def get_conn(path: Path = DB_PATH):
+    """Yield the shared connection under its lock, committing on success and rolling back on error."""
+
+    with _CONNECTIONS_LOCK:
+        conn = _connection(path)
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+
+
+# Batched with executemany (which cannot return rows); ids are then resolved by name.
+_UPSERT_PRODUCTS_SQL = """
+    INSERT INTO products (name, category, first_seen, last_updated, trend_score, image_url, status)
+    VALUES (:name, :category, :now, :now, ROUND(MIN(:increment, 100), 2), :image_url, 'new')
+    ON CONFLICT(name) DO UPDATE SET
+        last_updated = excluded.last_updated,
+        trend_score = ROUND(MIN(products.trend_score * 0.7 + :increment, 100), 2),
+        image_url = COALESCE(excluded.image_url, products.image_url)
+"""
+
+_UPSERT_PRODUCT_SQL = _UPSERT_PRODUCTS_SQL + "    RETURNING id\n"
+
+# Stay well below SQLite's bound-parameter limit when resolving ids by name.
+NAME_LOOKUP_CHUNK = 500
+
+
+def upsert_product(record: ProductRecord, *, conn: sqlite3.Connection, now: str | None = None,
+                   increment: float | None = None) -> int:
+    """Insert or refresh a product in one statement, decaying the existing score in SQL."""
+
+    row = conn.execute(_UPSERT_PRODUCT_SQL, _product_params(record, now, increment)).fetchone()
+    product_id = row["id"]
+    LOGGER.debug("Upserted product %s -> id %s", record.name, product_id)
+    return product_id
+
+
+def _product_params(record: ProductRecord, now: str | None = None, increment: float | None = None) -> dict:
+    return {
+        "name": record.name,
+        "category": record.metadata.get("category") if record.metadata else None,
+        "now": now or datetime.utcnow().isoformat(),
+        "increment": score_increment(record) if increment is None else increment,
+        "image_url": record.image_url,
+    }
+
+
+def _product_ids(conn: sqlite3.Connection, names: Iterable[str]) -> Dict[str, int]:
+    """Map product names to ids with one ``IN`` query per chunk of names."""
+
+    names = list(dict.fromkeys(names))
+    ids: Dict[str, int] = {}
+    for start in range(0, len(names), NAME_LOOKUP_CHUNK):
+        chunk = names[start:start + NAME_LOOKUP_CHUNK]
+        placeholders = ",".join("?" for _ in chunk)
+        for row in conn.execute(f"SELECT name, id FROM products WHERE name IN ({placeholders})", chunk):
+            ids[row["name"]] = row["id"]
+    return ids
+
+
+# One metrics row per product per day; repeated same-day scrapes overwrite it.
+_INSERT_METRIC_SQL = """
+    INSERT INTO metrics (product_id, date, reviews, orders, price, currency, social_mentions)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(product_id, date) DO UPDATE SET
+        reviews = excluded.reviews,
+        orders = excluded.orders,
+        price = excluded.price,
+        currency = excluded.currency,
+        social_mentions = excluded.social_mentions
+"""
+
+# A product/url pair is stored once; seeing it again only refreshes found_at.
+_INSERT_SOURCE_SQL = """
+    INSERT INTO sources (product_id, platform, url, found_at)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(product_id, url) DO UPDATE SET found_at = excluded.found_at
+"""
+
+
+def _metric_row(product_id: int, record: ProductRecord, now: str | None = None) -> tuple:
+    return (
+        product_id,
+        (now or datetime.utcnow().isoformat())[:10],
+        record.reviews,
+        record.orders,
+        record.price,
+        record.currency,
+        record.metadata.get("social_mentions") if record.metadata else None,
+    )
+
+
+def _source_row(product_id: int, record: ProductRecord, now: str | None = None) -> tuple:
+    return (
+        product_id,
+        record.platform,
+        record.url,
+        now or datetime.utcnow().isoformat(),
     )
 
 
+def add_metric(product_id: int, record: ProductRecord, *, conn: sqlite3.Connection,
+               now: str | None = None) -> None:
+    conn.execute(_INSERT_METRIC_SQL, _metric_row(product_id, record, now))
+
+
+def add_source(product_id: int, record: ProductRecord, *, conn: sqlite3.Connection,
+               now: str | None = None) -> None:
+    conn.execute(_INSERT_SOURCE_SQL, _source_row(product_id, record, now))
+
+
 def persist_records(records: Iterable[ProductRecord], path: Path = DB_PATH) -> None:
+    records = list(records)
     if not records:
         return
+    # One timestamp for the whole batch; the metric date is its YYYY-MM-DD prefix.
+    now = datetime.utcnow().isoformat()
+    increments = score_increments(records).tolist()
     with get_conn(path) as conn:
-        for record in records:
-            product_id = upsert_product(record, conn=conn)
-            add_metric(product_id, record, conn=conn)
-            add_source(product_id, record, conn=conn)
-        conn.commit()
-
-
-def compute_trend_score(record: ProductRecord, existing_score: float | None = None) -> float:
-    base_score = existing_score or 0
-    score = base_score * 0.7
-    reviews = record.reviews or 0
-    orders = record.orders or 0
-    badges = len(record.badges or [])
-    rating = record.rating or 0
-
-    score += min(reviews / 100, 40)
-    score += min(orders / 50, 30)
+        with conn:
+            # Take the write lock up front so the batch cannot fail half-way on a lock upgrade.
+            conn.execute("BEGIN IMMEDIATE")
+            conn.executemany(
+                _UPSERT_PRODUCTS_SQL,
+                [_product_params(record, now, increment) for record, increment in zip(records, increments)],
+            )
+            ids = _product_ids(conn, (record.name for record in records))
+            metric_rows = [_metric_row(ids[record.name], record, now) for record in records]
+            source_rows = [_source_row(ids[record.name], record, now) for record in records]
+            conn.executemany(_INSERT_METRIC_SQL, metric_rows)
+            conn.executemany(_INSERT_SOURCE_SQL, source_rows)
+        # Refresh planner statistics so the filter indexes are picked up.
+        conn.execute("PRAGMA optimize")
+
+
+def score_increment(record: ProductRecord) -> float:
+    """Return the unclamped score a single observation adds on top of the decayed score."""
+
+    return float(score_increments([record])[0])
+
+
+def score_increments(records: Sequence[ProductRecord]) -> np.ndarray:
+    """Return each record's unclamped score increment, computed for the whole batch at once."""
+
+    reviews = np.fromiter((record.reviews or 0 for record in records), dtype=float, count=len(records))
+    orders = np.fromiter((record.orders or 0 for record in records), dtype=float, count=len(records))
+    badges = np.fromiter((len(record.badges or []) for record in records), dtype=float, count=len(records))
+    rating = np.fromiter((record.rating or 0 for record in records), dtype=float, count=len(records))
+    reddit = np.fromiter(
+        (
+            bool(record.metadata)
+            and record.metadata.get("source_url", "").startswith("https://www.reddit.com")
+            for record in records
+        ),
+        dtype=bool,
+        count=len(records),
+    )
+    score = np.minimum(reviews / 100, 40)
+    score += np.minimum(orders / 50, 30)
     score += badges * 5
     score += (rating / 5) * 10
-    if record.metadata:
-        if record.metadata.get("source_url", "").startswith("https://www.reddit.com"):
-            score += 5
-    return round(min(score, 100), 2)
+    score += np.where(reddit, 5.0, 0.0)
+    return score
+
+
+def fetch_metrics_for_products(product_ids: Sequence[int], limit_per: int = 25,
+                               path: Path = DB_PATH) -> Dict[int, List[sqlite3.Row]]:
+    """Return the latest ``limit_per`` metric rows for each product, oldest first."""
+
+    histories: Dict[int, List[sqlite3.Row]] = {product_id: [] for product_id in product_ids}
+    if not histories:
+        return histories
+    placeholders = ",".join("?" for _ in histories)
+    with get_conn(path) as conn:
+        cursor = conn.execute(
+            f"""
+            SELECT product_id, date, reviews, orders, price
+            FROM (
+                SELECT id, product_id, date, reviews, orders, price,
+                       ROW_NUMBER() OVER (PARTITION BY product_id ORDER BY date DESC, id DESC) AS rn
+                FROM metrics
+                WHERE product_id IN ({placeholders})
+            )
+            WHERE rn <= ?
+            ORDER BY product_id, date ASC, id ASC
+            """,
+            (*histories, limit_per),
+        )
+        for row in cursor:
+            histories[row["product_id"]].append(row)
+    return histories
+
+
+_SELECT_PLATFORMS_SQL = "SELECT DISTINCT platform FROM sources ORDER BY platform"
+
+_UPDATE_STATUS_SQL = "UPDATE products SET status = ?, notes = COALESCE(?, notes) WHERE id = ?"
+
+
+def fetch_platforms(path: Path = DB_PATH) -> List[str]:
+    """Return the distinct platforms products have been sourced from."""
+
+    with get_conn(path) as conn:
+        return [row["platform"] for row in conn.execute(_SELECT_PLATFORMS_SQL)]
 
 
 def update_status(product_id: int, status: str, notes: str | None = None) -> None:
     with get_conn() as conn:
         conn.execute(
-            "UPDATE products SET status = ?, notes = COALESCE(?, notes) WHERE id = ?",
+            _UPDATE_STATUS_SQL,
             (status, notes, product_id),
         )
-        conn.commit()
 
@@ -1,41 +1,59 @@
-"""Manual entry point to run all scrapers sequentially."""
+"""Legacy manual entry point that runs the function-style scrapers, each in its own worker process.
+
+This module cannot currently be imported: it and the ``scrapers.amazon``/``aliexpress``/``reddit``
+modules depend on ``database.record_products``, ``scrapers.selenium_session``/``sleep_random`` and
+per-site URL settings in ``config`` that no longer exist. Use ``python scheduler.py`` instead,
+which runs the class-based scrapers in parallel via ``scheduler.run_scraper``.
+"""
 from __future__ import annotations
 
 import argparse
 import logging
+import multiprocessing
 import time
-from typing import Dict, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List
 
+import numpy as np
 import schedule
 
 from database import init_db, record_products
-from scrapers import sleep_random
 from scrapers import aliexpress, amazon, reddit
 
 logger = logging.getLogger(__name__)
+
+COUNT_FIELDS = ("reviews", "orders", "votes", "comments")
+_THOUSANDS_SEPARATORS = str.maketrans("", "", ",")
+
+SCRAPERS: Dict[str, Callable[[], List[Dict[str, object]]]] = {
+    "amazon": amazon.scrape,
+    "aliexpress": aliexpress.scrape,
+    "reddit": reddit.scrape,
+}
+
+# Spawned (not forked) workers so no browser or SQLite state is inherited.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 
 
 def run_all() -> List[Dict[str, object]]:
-    """Run all available scrapers and persist their findings."""
+    """Run all available scrapers in parallel processes and persist their findings."""
     init_db()
     harvested: List[Dict[str, object]] = []
 
-    for name, scraper in (
-        ("amazon", amazon.scrape),
-        ("aliexpress", aliexpress.scrape),
-        ("reddit", reddit.scrape),
-    ):
-        try:
-            logger.info("Starting %s scraper", name)
-            results = scraper()
-            for payload in results:
-                payload["trend_score"] = _compute_trend_score(payload)
-                payload.setdefault("description", f"Discovered via {payload['platform']}")
-            harvested.extend(results)
-            sleep_random()
-        except Exception as exc:  # noqa: BLE001
-            logger.exception("%s scraper failed: %s", name, exc)
+    # Each site is independent, so scrape them concurrently; every worker owns its own browser.
+    with ProcessPoolExecutor(max_workers=len(SCRAPERS), mp_context=_MP_CONTEXT) as executor:
+        futures = {executor.submit(_run_one, name): name for name in SCRAPERS}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results = [_flatten_metrics(payload) for payload in future.result()]
+                _score_batch(results)
+                for payload in results:
+                    payload.setdefault("description", f"Discovered via {payload['platform']}")
+                harvested.extend(results)
+            except Exception as exc:  # noqa: BLE001
+                logger.exception("%s scraper failed: %s", name, exc)
 
     if harvested:
         logger.info("Persisting %s product records", len(harvested))
@@ -46,6 +64,11 @@ def run_all() -> List[Dict[str, object]]:
     return harvested
 
 
+def _run_one(name: str) -> List[Dict[str, object]]:
+    logger.info("Starting %s scraper", name)
+    return SCRAPERS[name]()
+
+
 def run_scheduler(interval_hours: float) -> None:
     """Continuously run the scrapers on a simple interval."""
     logger.info("Scheduling scrapes every %.2f hours", interval_hours)
@@ -60,61 +83,64 @@ def run_scheduler(interval_hours: float) -> None:
         logger.info("Scheduler stopped by user")
 
 
-def _compute_trend_score(payload: Dict[str, object]) -> float:
-    metrics = payload.get("metrics", {})
-    rating = metrics.get("rating") or payload.get("rating") or 0
-    reviews = metrics.get("reviews") or payload.get("reviews") or 0
-    orders = metrics.get("orders") or payload.get("orders") or 0
-    votes = metrics.get("votes") or payload.get("votes") or 0
-    comments = metrics.get("comments") or payload.get("comments") or 0
-
-    if isinstance(reviews, str):
-        reviews = _safe_int(reviews)
-    if isinstance(orders, str):
-        orders = _safe_int(orders)
-    if isinstance(votes, str):
-        votes = _safe_int(votes)
-    if isinstance(comments, str):
-        comments = _safe_int(comments)
-
-    score = 10.0
-    if rating:
-        if rating >= 4.7:
-            score += 25
-        elif rating >= 4.3:
-            score += 15
-        elif rating >= 4.0:
-            score += 8
-    if reviews:
-        if reviews < 500:
-            score += 20
-        elif reviews < 2000:
-            score += 10
-        elif reviews > 10000:
-            score -= 15
-    if orders:
-        if 100 <= orders <= 2000:
-            score += 20
-        elif orders < 100:
-            score += 10
-        elif orders > 4000:
-            score -= 10
-    if votes:
-        if votes > 2000:
-            score += 25
-        elif votes > 500:
-            score += 15
-        elif votes > 100:
-            score += 8
-    if comments and comments > 100:
-        score += 5
-
-    return max(0.0, min(score, 100.0))
+def _score_batch(payloads: List[Dict[str, object]]) -> None:
+    """Assign ``trend_score`` to every payload using vectorised threshold rules."""
+    if not payloads:
+        return
+
+    rating = _metric_array(payloads, "rating", np.float64)
+    reviews = _metric_array(payloads, "reviews", np.int64)
+    orders = _metric_array(payloads, "orders", np.int64)
+    votes = _metric_array(payloads, "votes", np.int64)
+    comments = _metric_array(payloads, "comments", np.int64)
+
+    score = np.full(len(payloads), 10.0)
+    score += np.select([rating >= 4.7, rating >= 4.3, rating >= 4.0], [25, 15, 8], 0)
+    has_reviews = reviews != 0
+    score += np.select(
+        [has_reviews & (reviews < 500), has_reviews & (reviews < 2000), reviews > 10000],
+        [20, 10, -15],
+        0,
+    )
+    has_orders = orders != 0
+    score += np.select(
+        [(orders >= 100) & (orders <= 2000), has_orders & (orders < 100), orders > 4000],
+        [20, 10, -10],
+        0,
+    )
+    score += np.select([votes > 2000, votes > 500, votes > 100], [25, 15, 8], 0)
+    score += np.where(comments > 100, 5, 0)
+    score = np.clip(score, 0.0, 100.0)
+
+    for payload, value in zip(payloads, score):
+        payload["trend_score"] = float(value)
+
+
+def _metric_array(payloads: List[Dict[str, object]], key: str, dtype) -> np.ndarray:
+    values = (payload.get(key) or 0 for payload in payloads)
+    return np.fromiter(values, dtype=dtype, count=len(payloads))
+
+
+def _flatten_metrics(payload: Dict[str, object]) -> Dict[str, object]:
+    """Fold ``payload["metrics"]`` into the payload and normalise count fields once."""
+    for key, value in (payload.get("metrics") or {}).items():
+        if value:
+            payload[key] = value
+    for key in COUNT_FIELDS:
+        if key in payload:
+            payload[key] = _safe_int(payload[key])
+    return payload
 
 
 def _safe_int(value) -> int | None:
+    if value is None or isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.translate(_THOUSANDS_SEPARATORS)
+        if not value:
+            return None
     try:
-        return int(str(value).replace(",", ""))
+        return int(value)
     except (TypeError, ValueError):
         return None
 
@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import time
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, Type
 
+from apscheduler.executors.pool import ProcessPoolExecutor as JobProcessPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from config import DATA_DIR, SCRAPE_INTERVAL_HOURS
-from database import init_db, persist_records
+from database import close_connections, init_db, persist_records
 from scrapers import (
     AliExpressTrendingScraper,
     AmazonMoversShakersScraper,
@@ -26,25 +29,31 @@ SCRAPERS: Dict[str, Type[SeleniumScraper]] = {
     "reddit": RedditRisingScraper,
 }
 
+# Spawned (not forked) workers so Chrome and SQLite state never leak across processes.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
 
 class ScraperScheduler:
-    """Wrapper around APScheduler that sequentially runs scrapers."""
+    """Wrapper around APScheduler that runs each scraper in its own worker process."""
 
     def __init__(self, scraper_names: Iterable[str] | None = None):
-        self.scheduler = BackgroundScheduler()
         self.scraper_names = tuple(scraper_names or SCRAPERS.keys())
+        executor = JobProcessPoolExecutor(
+            max_workers=len(self.scraper_names),
+            pool_kwargs={"mp_context": _MP_CONTEXT, "initializer": configure_logging},
+        )
+        self.scheduler = BackgroundScheduler(executors={"default": executor})
 
     def start(self) -> None:
         init_db()
         for name in self.scraper_names:
-            scraper_cls = SCRAPERS[name]
             interval_hours = SCRAPE_INTERVAL_HOURS.get(name, 24)
             LOGGER.info("Scheduling %s every %s hours", name, interval_hours)
             self.scheduler.add_job(
-                self._run_scraper,
+                run_scraper,
                 "interval",
                 hours=interval_hours,
-                args=[scraper_cls],
+                args=[name],
                 id=name,
                 replace_existing=True,
             )
@@ -52,27 +61,33 @@ class ScraperScheduler:
 
     def shutdown(self) -> None:
         self.scheduler.shutdown()
+        close_connections()
 
     def run_now(self) -> None:
-        for name in self.scraper_names:
-            self._run_scraper(SCRAPERS[name])
+        _run_parallel(self.scraper_names)
+
+
+def run_scraper(name: str) -> int:
+    """Scrape one platform and persist its records; runs inside a worker process."""
+
+    scraper_cls = SCRAPERS[name]
+    LOGGER.info("Running scraper %s", scraper_cls.__name__)
+    records = scraper_cls().fetch()
+    persist_records(records)
+    LOGGER.info("Persisted %d records from %s", len(records), scraper_cls.__name__)
+    return len(records)
+
 
-    def _run_scraper(self, scraper_cls: Type[SeleniumScraper]) -> None:
-        LOGGER.info("Running scraper %s", scraper_cls.__name__)
-        scraper = scraper_cls()
-        records = scraper.fetch()
-        persist_records(records)
-        LOGGER.info("Persisted %d records from %s", len(records), scraper_cls.__name__)
+def _run_parallel(names: Iterable[str]) -> None:
+    names = tuple(names)
+    with ProcessPoolExecutor(max_workers=len(names), mp_context=_MP_CONTEXT,
+                             initializer=configure_logging) as executor:
+        list(executor.map(run_scraper, names))
 
 
 def run_once(scraper_names: Iterable[str] | None = None) -> None:
     init_db()
-    names = tuple(scraper_names or SCRAPERS.keys())
-    for name in names:
-        scraper_cls = SCRAPERS[name]
-        LOGGER.info("Running scraper %s", name)
-        scraper = scraper_cls()
-        persist_records(scraper.fetch())
+    _run_parallel(scraper_names or SCRAPERS.keys())
 
 
 def start_scheduler(scraper_names: Iterable[str] | None = None) -> ScraperScheduler:
@@ -1,4 +1,12 @@
 """Scraper package exports."""
+from __future__ import annotations
+
+from typing import Iterable, Pattern, Tuple
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
 from .amazon_scraper import AmazonMoversShakersScraper
 from .aliexpress_scraper import AliExpressTrendingScraper
 from .reddit_scraper import RedditRisingScraper
@@ -7,4 +15,32 @@ __all__ = [
     "AmazonMoversShakersScraper",
     "AliExpressTrendingScraper",
     "RedditRisingScraper",
+    "looks_blocked",
+    "wait_for_any",
 ]
+
+# CAPTCHA interstitials replace the whole page, so scanning its head is enough and avoids
+# lowercasing a multi-megabyte copy of the source.
+BLOCK_SCAN_CHARS = 64 * 1024
+
+
+def looks_blocked(page_source: str, pattern: Pattern[str]) -> bool:
+    """Return whether ``pattern`` (a site's CAPTCHA markers) appears near the top of the page."""
+
+    return pattern.search(page_source, 0, BLOCK_SCAN_CHARS) is not None
+
+
+def wait_for_any(driver, selectors: Iterable[Tuple[str, str]], timeout: float = 30) -> None:
+    """Block until any ``(by, value)`` locator is present, e.g. ``("CSS_SELECTOR", "div.item")``.
+
+    All locators are polled together by a single ``WebDriverWait``; raises
+    ``TimeoutException`` when none appears within ``timeout`` seconds.
+    """
+
+    conditions = []
+    for by, value in selectors:
+        strategy = getattr(By, by.upper(), None)
+        if strategy is None:
+            raise ValueError(f"Unknown locator strategy: {by}")
+        conditions.append(EC.presence_of_element_located((strategy, value)))
+    WebDriverWait(driver, timeout, poll_frequency=0.25).until(EC.any_of(*conditions))
@@ -2,16 +2,22 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Dict, List
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from selenium.common.exceptions import TimeoutException
 
 from config import ALIEXPRESS_TRENDING_URL, MAX_PRODUCTS_PER_SOURCE
-from scrapers import selenium_session, sleep_random, wait_for_any
+from scrapers import looks_blocked, selenium_session, sleep_random, wait_for_any
 
 logger = logging.getLogger(__name__)
 
+_CAPTCHA_RE = re.compile(r"captcha", re.IGNORECASE)
+
+# Characters stripped from price and count text (e.g. "US $1,234.50") before numeric conversion.
+_NUMBER_NOISE = str.maketrans("", "", "US $,\xa0")
+
 
 def scrape() -> List[Dict[str, object]]:
     """Return trending product payloads from AliExpress."""
@@ -34,12 +40,12 @@ def scrape() -> List[Dict[str, object]]:
 
         sleep_random()
         page_source = driver.page_source
-        if "captcha" in page_source.lower():
+        if looks_blocked(page_source, _CAPTCHA_RE):
             logger.warning("AliExpress presented a CAPTCHA challenge; skipping run")
             return results
 
-        soup = BeautifulSoup(page_source, "html.parser")
-        product_nodes = soup.select("div.JIIxO, div.list-item")
+        tree = LexborHTMLParser(page_source)
+        product_nodes = tree.css("div.JIIxO, div.list-item")
 
         for node in product_nodes[:MAX_PRODUCTS_PER_SOURCE]:
             info = _parse_product(node)
@@ -48,52 +54,46 @@ def scrape() -> List[Dict[str, object]]:
             info["platform"] = "AliExpress"
             info["metrics"] = _build_metrics(info)
             results.append(info)
-            sleep_random()
 
     return results
 
 
 def _parse_product(node) -> Dict[str, object] | None:
-    title_elem = node.select_one("a._3t7zg, a.item-title")
+    title_elem = node.css_first("a._3t7zg, a.item-title")
     if not title_elem:
         return None
 
-    name = title_elem.get_text(strip=True)
-    url = title_elem.get("href")
+    name = title_elem.text(strip=True)
+    url = title_elem.attributes.get("href")
     if url and url.startswith("//"):
         url = f"https:{url}"
 
-    image_elem = node.select_one("img")
-    price_elem = node.select_one("div._1NoI8, span.price")
-    orders_elem = node.select_one("span._1kNf9, span.item-sold")
-    rating_elem = node.select_one("span._1cE1T")
+    image_elem = node.css_first("img")
+    price_elem = node.css_first("div._1NoI8, span.price")
+    orders_elem = node.css_first("span._1kNf9, span.item-sold")
+    rating_elem = node.css_first("span._1cE1T")
 
     payload: Dict[str, object] = {
         "name": name,
         "url": url,
-        "image_url": image_elem.get("src") if image_elem else None,
+        "image_url": image_elem.attributes.get("src") if image_elem else None,
     }
 
     if price_elem:
-        price_text = (
-            price_elem.get_text(strip=True)
-            .replace("US $", "")
-            .replace("$", "")
-            .replace(",", "")
-        )
+        price_text = price_elem.text(strip=True).translate(_NUMBER_NOISE)
         try:
             payload["price"] = float(price_text)
         except ValueError:
             pass
     if orders_elem:
-        orders_text = orders_elem.get_text(strip=True).split(" ")[0].replace(",", "")
+        orders_text = orders_elem.text(strip=True).split(" ")[0].translate(_NUMBER_NOISE)
         try:
             payload["orders"] = int(orders_text)
         except ValueError:
             pass
     if rating_elem:
         try:
-            payload["rating"] = float(rating_elem.get_text(strip=True))
+            payload["rating"] = float(rating_elem.text(strip=True))
         except ValueError:
             pass
 
@@ -4,10 +4,9 @@ from __future__ import annotations
 import logging
 from typing import List
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from selenium.webdriver import Chrome
 
-from config import SELECTORS
 from .base_scraper import ProductRecord, SeleniumScraper, parse_price, safe_int
 
 LOGGER = logging.getLogger(__name__)
@@ -21,28 +20,36 @@ class AliExpressTrendingScraper(SeleniumScraper):
     )
 
     def parse(self, driver: Chrome, url: str) -> List[ProductRecord]:
-        selector = SELECTORS[self.platform]
+        selector = self.selectors
         self.wait_for_any(driver, [selector.product_container])
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        tree = LexborHTMLParser(self.container_html(driver, selector.product_container))
         records: List[ProductRecord] = []
-        badge_selector = ",".join(filter(None, selector.badges.values())) if selector.badges else ""
-        for product in soup.select(selector.product_container):
-            name_el = product.select_one(selector.name)
+        badge_selector = self.badge_selector
+        # Resolve per-field selectors once; the loop below runs for every product node.
+        name_sel = selector.name
+        link_sel = selector.link
+        price_sel = selector.price
+        image_sel = selector.image
+        orders_sel = selector.orders
+        # current_url is a WebDriver round-trip; read it once per page, not per product.
+        source_url = driver.current_url
+        for product in tree.body.iter():
+            name_el = product.css_first(name_sel)
             if not name_el:
                 continue
-            name = name_el.get_text(strip=True)
-            link_el = product.select_one(selector.link)
-            product_url = link_el.get("href") if link_el else url
-            price_el = product.select_one(selector.price) if selector.price else None
-            price, currency = parse_price(price_el.get_text() if price_el else None)
-            image_el = product.select_one(selector.image) if selector.image else None
-            image = image_el.get("src") if image_el else None
-            orders_el = product.select_one(selector.orders) if selector.orders else None
-            orders = safe_int(orders_el.get_text() if orders_el else None)
-            badges = [badge.get_text(strip=True) for badge in product.select(badge_selector)] if badge_selector else []
+            name = name_el.text(strip=True)
+            link_el = product.css_first(link_sel)
+            product_url = link_el.attributes.get("href") if link_el else url
+            price_el = product.css_first(price_sel) if price_sel else None
+            price, currency = parse_price(price_el.text() if price_el else None)
+            image_el = product.css_first(image_sel) if image_sel else None
+            image = image_el.attributes.get("src") if image_el else None
+            orders_el = product.css_first(orders_sel) if orders_sel else None
+            orders = safe_int(orders_el.text() if orders_el else None)
+            badges = [badge.text(strip=True) for badge in product.css(badge_selector)] if badge_selector else []
 
             metadata = {
-                "source_url": driver.current_url,
+                "source_url": source_url,
             }
 
             record = ProductRecord(
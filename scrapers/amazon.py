@@ -2,16 +2,22 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Dict, List
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from selenium.common.exceptions import TimeoutException
 
 from config import AMAZON_MOVERS_URL, MAX_PRODUCTS_PER_SOURCE
-from scrapers import selenium_session, sleep_random, wait_for_any
+from scrapers import looks_blocked, selenium_session, sleep_random, wait_for_any
 
 logger = logging.getLogger(__name__)
 
+_CAPTCHA_RE = re.compile(r"captcha|robot check", re.IGNORECASE)
+
+# Characters stripped from price and count text before numeric conversion.
+_NUMBER_NOISE = str.maketrans("", "", "$,\xa0")
+
 
 def scrape() -> List[Dict[str, object]]:
     """Return trending product payloads from Amazon."""
@@ -34,12 +40,12 @@ def scrape() -> List[Dict[str, object]]:
 
         sleep_random()
         page_source = driver.page_source
-        if "captcha" in page_source.lower() or "robot check" in page_source.lower():
+        if looks_blocked(page_source, _CAPTCHA_RE):
             logger.warning("Amazon presented a CAPTCHA challenge; skipping run")
             return results
 
-        soup = BeautifulSoup(page_source, "html.parser")
-        product_nodes = soup.select("div.p13n-gridRow div.zg-grid-general-faceout, div#gridItemRoot")
+        tree = LexborHTMLParser(page_source)
+        product_nodes = tree.css("div.p13n-gridRow div.zg-grid-general-faceout, div#gridItemRoot")
 
         for node in product_nodes[:MAX_PRODUCTS_PER_SOURCE]:
             info = _parse_product(node)
@@ -48,46 +54,45 @@ def scrape() -> List[Dict[str, object]]:
             info["platform"] = "Amazon"
             info["metrics"] = _build_metrics(info)
             results.append(info)
-            sleep_random()
 
     return results
 
 
 def _parse_product(node) -> Dict[str, object] | None:
-    title_elem = node.select_one("span._cDEzb_p13n-sc-css-line-clamp-3_g3dy1, span.p13n-sc-truncate")
-    link_elem = node.select_one("a.a-link-normal")
+    title_elem = node.css_first("span._cDEzb_p13n-sc-css-line-clamp-3_g3dy1, span.p13n-sc-truncate")
+    link_elem = node.css_first("a.a-link-normal")
     if not title_elem or not link_elem:
         return None
 
-    name = title_elem.get_text(strip=True)
-    url = link_elem.get("href")
+    name = title_elem.text(strip=True)
+    url = link_elem.attributes.get("href")
     if url and url.startswith("/"):
         url = f"https://www.amazon.com{url}"
 
-    image_elem = node.select_one("img")
-    rating_elem = node.select_one("span.a-icon-alt")
-    reviews_elem = node.select_one("span.a-size-small.a-color-secondary")
-    price_elem = node.select_one("span.p13n-sc-price")
+    image_elem = node.css_first("img")
+    rating_elem = node.css_first("span.a-icon-alt")
+    reviews_elem = node.css_first("span.a-size-small.a-color-secondary")
+    price_elem = node.css_first("span.p13n-sc-price")
 
     payload: Dict[str, object] = {
         "name": name,
         "url": url,
-        "image_url": image_elem.get("src") if image_elem else None,
+        "image_url": image_elem.attributes.get("src") if image_elem else None,
     }
 
     if rating_elem:
-        rating_text = rating_elem.get_text(strip=True).split(" ")[0]
+        rating_text = rating_elem.text(strip=True).split(" ")[0]
         try:
             payload["rating"] = float(rating_text)
         except ValueError:
             pass
     if reviews_elem:
         try:
-            payload["reviews"] = int(reviews_elem.get_text(strip=True).replace(",", ""))
+            payload["reviews"] = int(reviews_elem.text(strip=True).translate(_NUMBER_NOISE))
         except ValueError:
             pass
     if price_elem:
-        price_text = price_elem.get_text(strip=True).replace("$", "").replace(",", "")
+        price_text = price_elem.text(strip=True).translate(_NUMBER_NOISE)
         try:
             payload["price"] = float(price_text)
         except ValueError:
@@ -4,10 +4,9 @@ from __future__ import annotations
 import logging
 from typing import List
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from selenium.webdriver import Chrome
 
-from config import SELECTORS
 from .base_scraper import ProductRecord, SeleniumScraper, parse_price, safe_float, safe_int
 
 LOGGER = logging.getLogger(__name__)
@@ -23,37 +22,44 @@ class AmazonMoversShakersScraper(SeleniumScraper):
     def parse(self, driver: Chrome, url: str) -> List[ProductRecord]:  # noqa: D401
         """Return parsed product records for the provided Amazon page."""
 
-        selector = SELECTORS[self.platform]
+        selector = self.selectors
         self.wait_for_any(driver, [selector.product_container])
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        tree = LexborHTMLParser(self.container_html(driver, selector.product_container))
         records: List[ProductRecord] = []
-        badge_selector = ",".join(filter(None, selector.badges.values())) if selector.badges else ""
-        for product in soup.select(selector.product_container):
-            name_el = product.select_one(selector.name)
+        badge_selector = self.badge_selector
+        # Resolve per-field selectors once; the loop below runs for every product node.
+        name_sel = selector.name
+        link_sel = selector.link
+        price_sel = selector.price
+        rating_sel = selector.rating
+        reviews_sel = selector.reviews
+        image_sel = selector.image
+        # current_url is a WebDriver round-trip; read it once per page, not per product.
+        source_url = driver.current_url
+        for product in tree.body.iter():
+            name_el = product.css_first(name_sel)
             if not name_el:
                 continue
-            name = name_el.get_text(strip=True)
-            link_el = product.select_one(selector.link)
-            url = (
-                f"https://www.amazon.com{link_el['href']}" if link_el and link_el.has_attr("href")
-                else driver.current_url
-            )
-            price_el = product.select_one(selector.price) if selector.price else None
-            price, currency = parse_price(price_el.get_text() if price_el else None)
-            rating_el = product.select_one(selector.rating) if selector.rating else None
-            rating = safe_float(rating_el.get_text().split()[0] if rating_el else None)
-            reviews_el = product.select_one(selector.reviews) if selector.reviews else None
-            reviews = safe_int(reviews_el.get_text() if reviews_el else None)
-            image_el = product.select_one(selector.image) if selector.image else None
-            image = image_el.get("src") if image_el else None
+            name = name_el.text(strip=True)
+            link_el = product.css_first(link_sel)
+            href = link_el.attributes.get("href") if link_el else None
+            url = f"https://www.amazon.com{href}" if href else source_url
+            price_el = product.css_first(price_sel) if price_sel else None
+            price, currency = parse_price(price_el.text() if price_el else None)
+            rating_el = product.css_first(rating_sel) if rating_sel else None
+            rating = safe_float(rating_el.text().split()[0] if rating_el else None)
+            reviews_el = product.css_first(reviews_sel) if reviews_sel else None
+            reviews = safe_int(reviews_el.text() if reviews_el else None)
+            image_el = product.css_first(image_sel) if image_sel else None
+            image = image_el.attributes.get("src") if image_el else None
 
             badges = [
-                badge_el.get_text(strip=True)
-                for badge_el in product.select(badge_selector)
+                badge_el.text(strip=True)
+                for badge_el in product.css(badge_selector)
             ] if badge_selector else []
 
             metadata = {
-                "source_url": driver.current_url,
+                "source_url": source_url,
             }
 
             record = ProductRecord(
@@ -1,17 +1,28 @@
 """Shared Selenium scraping utilities."""
 from __future__ import annotations
 
+import atexit
 import json
 import logging
 import random
+import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Iterable, List, Optional
 
 import undetected_chromedriver as uc
+
+try:  # Optional C JSON encoder; dump_records falls back to the stdlib json module.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment
+    orjson = None
+from lxml import etree
+from lxml.cssselect import LxmlTranslator
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver import Chrome
 from selenium.webdriver.chrome.options import Options
@@ -20,6 +31,7 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from config import (
+    BROWSER_POOL_SIZE,
     DEFAULT_HEADLESS,
     HTML_DEBUG_DIR,
     PAGE_LOAD_TIMEOUT,
@@ -28,10 +40,136 @@ from config import (
     SCREENSHOT_DIR,
     SELECTORS,
     USER_AGENTS,
+    SelectorConfig,
 )
 
 LOGGER = logging.getLogger(__name__)
 
+# Serialise only the matched containers in the browser rather than the whole DOM.
+_CONTAINER_HTML_SCRIPT = (
+    "return Array.from(document.querySelectorAll(arguments[0]), node => node.outerHTML).join('');"
+)
+
+# Media, fonts and stylesheets are never parsed, so don't download them. JS stays on because
+# the listing containers are rendered client-side.
+BLOCKED_RESOURCE_PATTERNS = (
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg",
+    "*.woff", "*.woff2", "*.ttf", "*.css", "*.mp4", "*.webm",
+)
+
+
+def _launch_driver(headless: bool, proxy: str | None, user_agent: str) -> Chrome:
+    options = Options()
+    options.headless = headless
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument(f"--user-agent={user_agent}")
+    if proxy:
+        options.add_argument(f"--proxy-server={proxy}")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    LOGGER.debug("Launching Chrome with user-agent=%s", user_agent)
+    driver = uc.Chrome(options=options)
+    driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_RESOURCE_PATTERNS)})
+    return driver
+
+
+def _browser_alive(driver: Chrome) -> bool:
+    """Cheap round-trip that fails only once the session or its window is gone."""
+
+    try:
+        return bool(driver.window_handles)
+    except Exception:  # pylint: disable=broad-except
+        return False
+
+
+class BrowserPool:
+    """Up to ``size`` reusable Chrome instances, launched lazily and lent out one per thread."""
+
+    def __init__(self, size: int = BROWSER_POOL_SIZE, *, headless: bool | None = None,
+                 proxy: str | None = PROXY_URL):
+        self.size = size
+        self.headless = DEFAULT_HEADLESS if headless is None else headless
+        self.proxy = proxy
+        self._idle: List[Chrome] = []
+        self._launched = 0
+        # Signalled whenever a browser is returned or a launch slot frees up.
+        self._available = threading.Condition()
+
+    @contextmanager
+    def acquire(self) -> Iterable[Chrome]:
+        """Borrow a browser, launching one if the pool is not yet full, else wait for one."""
+
+        driver = self._checkout()
+        healthy = True
+        try:
+            yield driver
+        except BaseException:
+            # Page-level errors come from a working browser; only a dead session is dropped.
+            healthy = _browser_alive(driver)
+            raise
+        finally:
+            if healthy:
+                self._checkin(driver)
+            else:
+                self._discard(driver)
+
+    def _checkout(self) -> Chrome:
+        with self._available:
+            while not self._idle and self._launched >= self.size:
+                self._available.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._launched += 1
+        try:
+            return _launch_driver(self.headless, self.proxy, random.choice(USER_AGENTS))
+        except BaseException:
+            self._release_slot()
+            raise
+
+    def _checkin(self, driver: Chrome) -> None:
+        with self._available:
+            self._idle.append(driver)
+            self._available.notify()
+
+    def _release_slot(self) -> None:
+        with self._available:
+            self._launched -= 1
+            self._available.notify()
+
+    def _discard(self, driver: Chrome) -> None:
+        self._release_slot()
+        try:
+            driver.quit()
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.debug("Error while quitting Chrome", exc_info=True)
+
+    def close(self) -> None:
+        """Quit every idle browser in the pool."""
+
+        with self._available:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+
+_POOL: Optional[BrowserPool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_browser_pool(headless: bool | None = None, proxy: str | None = PROXY_URL) -> BrowserPool:
+    """Return the process-wide browser pool, creating it on first use."""
+
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = BrowserPool(headless=headless, proxy=proxy)
+            atexit.register(_POOL.close)
+        return _POOL
+
 
 @dataclass(slots=True)
 class ProductRecord:
@@ -50,11 +188,38 @@ class ProductRecord:
     metadata: Optional[dict] = None
 
 
+# Single background thread for debug artefact writes; pending writes are flushed at exit.
+_DEBUG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug-writer")
+atexit.register(_DEBUG_WRITER.shutdown, wait=True)
+
+
+def _write_artifact(path: Path, data: bytes, kind: str) -> None:
+    try:
+        path.write_bytes(data)
+        LOGGER.info("Saved debug %s to %s", kind, path)
+    except Exception:  # pylint: disable=broad-except
+        LOGGER.exception("Failed saving debug %s to %s", kind, path)
+
+
+_RECORD_FIELDS = tuple(field.name for field in fields(ProductRecord))
+
+
 class SeleniumScraper(ABC):
     """Base Selenium scraper that encapsulates defensive scraping behavior."""
 
     platform: str
     start_urls: Iterable[str]
+    selectors: Optional[SelectorConfig] = None
+    badge_selector: str = ""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Resolve the platform's selector config once, when the scraper class is defined."""
+
+        super().__init_subclass__(**kwargs)
+        platform = getattr(cls, "platform", None)
+        cls.selectors = SELECTORS.get(platform) if platform else None
+        badges = cls.selectors.badges if cls.selectors else None
+        cls.badge_selector = ",".join(filter(None, badges.values())) if badges else ""
 
     def __init__(self, headless: bool | None = None, *,
                  proxy: str | None = PROXY_URL, screenshot_dir: Path = SCREENSHOT_DIR):
@@ -68,60 +233,84 @@ class SeleniumScraper(ABC):
 
     @contextmanager
     def driver(self) -> Iterable[Chrome]:
-        """Context manager that yields a configured undetected-chromedriver instance."""
-
-        user_agent = self.random.choice(USER_AGENTS)
-        options = Options()
-        options.headless = self.headless
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(f"--user-agent={user_agent}")
-        if self.proxy:
-            options.add_argument(f"--proxy-server={self.proxy}")
-
-        LOGGER.debug("Launching Chrome with user-agent=%s", user_agent)
-        driver = uc.Chrome(options=options)
-        driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        """Context manager that borrows a browser from the process-wide pool.
 
-        try:
+        The browser outlives the block so the next scrape skips Chrome's cold start.
+        """
+
+        with get_browser_pool(self.headless, self.proxy).acquire() as driver:
             yield driver
-        finally:
-            driver.quit()
 
     @abstractmethod
     def parse(self, driver: Chrome, url: str) -> List[ProductRecord]:
         """Parse a page and return normalized product records."""
 
-    def fetch(self) -> List[ProductRecord]:
-        """Iterate over configured URLs and collect product records."""
-
-        records: List[ProductRecord] = []
-        with self.driver() as driver:
-            for url in self.start_urls:
-                try:
-                    LOGGER.info("Scraping %s", url)
-                    driver.get(url)
-                    self._random_delay()
-                    records.extend(self.parse(driver, url))
-                except TimeoutException:
-                    LOGGER.warning("Timeout fetching %s", url, exc_info=True)
-                except Exception:  # pylint: disable=broad-except
-                    LOGGER.exception("Unexpected error scraping %s", url)
-                    self._capture_debug_artifacts(driver, url)
-        return records
+    def fetch(self, urls: Iterable[str] | None = None) -> List[ProductRecord]:
+        """Iterate over configured URLs (or ``urls``) and collect product records.
+
+        URLs are loaded concurrently, one pooled browser per URL; the pool keeps the
+        browsers alive across runs in the same process.
+        """
+
+        urls = list(self.start_urls if urls is None else urls)
+        if not urls:
+            return []
+        workers = min(len(urls), get_browser_pool(self.headless, self.proxy).size)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.platform) as executor:
+            pages = list(executor.map(self._fetch_pooled, urls))
+        return [record for page in pages for record in page]
+
+    def _fetch_pooled(self, url: str) -> List[ProductRecord]:
+        try:
+            with self.driver() as driver:
+                return self._fetch_url(driver, url)
+        except Exception:  # pylint: disable=broad-except
+            # The pool has discarded the dead browser; lose this URL, not the whole scrape.
+            LOGGER.warning("Dropped browser after failure on %s", url)
+            return []
+
+    def _fetch_url(self, driver: Chrome, url: str) -> List[ProductRecord]:
+        """Load and parse ``url``; errors propagate only once the browser itself has died."""
+
+        try:
+            # Browsers are reused, so wipe every domain's cookies (delete_all_cookies only clears the
+            # current page's) to keep visits unlinked.
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            LOGGER.info("Scraping %s", url)
+            driver.get(url)
+            self._random_delay()
+            return self.parse(driver, url)
+        except TimeoutException:
+            LOGGER.warning("Timeout fetching %s", url, exc_info=True)
+        except Exception:  # pylint: disable=broad-except
+            LOGGER.exception("Unexpected error scraping %s", url)
+            if not _browser_alive(driver):
+                # Let the pool discard it; there is nothing left to capture.
+                raise
+            self._capture_debug_artifacts(driver, url)
+        return []
 
     def wait_for_any(self, driver: Chrome, selectors: List[str], by: By = By.CSS_SELECTOR, timeout: int = 30) -> None:
-        """Wait until any selector from the provided list is visible."""
+        """Wait until any selector from the provided list is visible.
+
+        The selectors are combined into one locator (a CSS selector group or an XPath union)
+        so a single wait covers them all and never exceeds ``timeout``.
+        """
+
+        combined = (" | " if by == By.XPATH else ", ").join(selectors)
+        try:
+            WebDriverWait(driver, timeout).until(EC.visibility_of_any_elements_located((by, combined)))
+        except TimeoutException:
+            raise TimeoutException(f"None of the selectors appeared: {selectors}") from None
+
+    def container_html(self, driver: Chrome, selector: str) -> str:
+        """Return the outerHTML of every element matching ``selector``, concatenated.
+
+        Parsing the result yields the containers as top-level nodes, so callers iterate the
+        fragment's children instead of re-running ``selector`` (whose ancestors are gone).
+        """
 
-        wait = WebDriverWait(driver, timeout)
-        for selector in selectors:
-            try:
-                wait.until(EC.visibility_of_element_located((by, selector)))
-                return
-            except TimeoutException:
-                LOGGER.debug("Timeout waiting for selector %s on %s", selector, driver.current_url)
-        raise TimeoutException(f"None of the selectors appeared: {selectors}")
+        return driver.execute_script(_CONTAINER_HTML_SCRIPT, selector) or ""
 
     def _capture_debug_artifacts(self, driver: Chrome, url: str) -> None:
         """Persist HTML and screenshot artefacts to help debugging failures."""
@@ -130,25 +319,54 @@ class SeleniumScraper(ABC):
         safe_name = url.replace("://", "_").replace("/", "_")[:100]
         screenshot_path = self.screenshot_dir / f"{safe_name}_{timestamp}.png"
         html_path = HTML_DEBUG_DIR / f"{safe_name}_{timestamp}.html"
+        # Capture from the browser now, before it moves on; the disk writes happen in the background.
         try:
-            driver.save_screenshot(str(screenshot_path))
-            LOGGER.info("Saved debug screenshot to %s", screenshot_path)
+            png = driver.get_screenshot_as_png()
         except Exception:  # pylint: disable=broad-except
-            LOGGER.exception("Failed saving screenshot")
+            LOGGER.exception("Failed capturing screenshot")
+        else:
+            _DEBUG_WRITER.submit(_write_artifact, screenshot_path, png, "screenshot")
         try:
             html = driver.page_source
-            html_path.write_text(html, encoding="utf-8")
-            LOGGER.info("Saved debug HTML to %s", html_path)
         except Exception:  # pylint: disable=broad-except
-            LOGGER.exception("Failed saving HTML source")
+            LOGGER.exception("Failed capturing HTML source")
+        else:
+            _DEBUG_WRITER.submit(_write_artifact, html_path, html.encode("utf-8"), "HTML")
 
     def _random_delay(self) -> None:
         delay = self.random.uniform(*RANDOM_DELAY_RANGE)
         LOGGER.debug("Sleeping for %.2f seconds", delay)
         time.sleep(delay)
 
-    def selector(self, platform: str) -> Optional[dict]:
-        return SELECTORS.get(platform)
+
+_CSS_TRANSLATOR = LxmlTranslator()
+
+
+def first_match_selector(css: str) -> etree.XPath:
+    """Compile ``css`` to an XPath that stops at the first match in document order, like select_one."""
+
+    return etree.XPath(f"({_CSS_TRANSLATOR.css_to_xpath(css)})[1]")
+
+
+def first_match(selector, node):
+    """Return the first element a compiled selector matches under ``node``, or None."""
+
+    if selector is None:
+        return None
+    matches = selector(node)
+    return matches[0] if matches else None
+
+
+def node_text(element, strip: bool = True) -> str:
+    """Return an lxml element's text content, stripping each fragment like BeautifulSoup's get_text."""
+
+    if strip:
+        return "".join(part.strip() for part in element.itertext())
+    return "".join(element.itertext())
+
+
+_NON_PRICE_CHARS = re.compile(r"[^\d.]")
+_NON_DIGITS = re.compile(r"\D")
 
 
 def parse_price(raw_price: str | None) -> tuple[Optional[float], Optional[str]]:
@@ -158,8 +376,7 @@ def parse_price(raw_price: str | None) -> tuple[Optional[float], Optional[str]]:
         return None, None
     cleaned = raw_price.strip()
     currency = cleaned[0] if cleaned and not cleaned[0].isdigit() else None
-    digits = "".join(ch for ch in cleaned if ch.isdigit() or ch in ".,")
-    digits = digits.replace(",", "")
+    digits = _NON_PRICE_CHARS.sub("", cleaned)
     try:
         value = float(digits)
     except (TypeError, ValueError):
@@ -170,7 +387,7 @@ def parse_price(raw_price: str | None) -> tuple[Optional[float], Optional[str]]:
 def safe_int(value: str | None) -> Optional[int]:
     if not value:
         return None
-    digits = "".join(ch for ch in value if ch.isdigit())
+    digits = _NON_DIGITS.sub("", value)
     try:
         return int(digits)
     except ValueError:
@@ -187,9 +404,24 @@ def safe_float(value: str | None) -> Optional[float]:
         return None
 
 
-def dump_records(records: List[ProductRecord], path: Path) -> None:
-    """Persist a JSON snapshot of records for debugging."""
+def dump_records(records: Iterable[ProductRecord], path: Path) -> None:
+    """Persist a JSON snapshot of records for debugging, writing one record at a time."""
+
+    with path.open("wb") as handle:
+        separator = b"[\n  "
+        for record in records:
+            handle.write(separator)
+            # ProductRecord uses slots, so read the fields directly (no __dict__, no asdict deep copy).
+            payload = {name: getattr(record, name) for name in _RECORD_FIELDS}
+            handle.write(_encode_json(payload).replace(b"\n", b"\n  "))
+            separator = b",\n  "
+        handle.write(b"[]" if separator.startswith(b"[") else b"\n]")
+
+
+def _encode_json(payload: dict) -> bytes:
+    """Encode ``payload`` as indented UTF-8 JSON, with orjson when it is installed."""
 
-    payload = [record.__dict__ for record in records]
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8")
 
@@ -2,21 +2,38 @@
 from __future__ import annotations
 
 import logging
+import re
 from typing import Dict, List
 
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml.cssselect import CSSSelector
 from selenium.common.exceptions import TimeoutException
 
 from config import MAX_PRODUCTS_PER_SOURCE, REDDIT_TRENDING_URL
-from scrapers import selenium_session, sleep_random, wait_for_any
+from scrapers import looks_blocked, sleep_random, wait_for_any
+from scrapers.base_scraper import get_browser_pool, node_text
 
 logger = logging.getLogger(__name__)
 
+# Compiled once at import. _FIELDS_SEL is the union of every per-post field selector, so each
+# post subtree is scanned once and the matches are dispatched by _post_fields().
+_POST_SEL = CSSSelector("div[data-testid='post-container'], div.Post")
+_FIELDS_SEL = CSSSelector(
+    "h3,"
+    " a[data-click-id='body'], a[data-testid='post-container'], a[data-click-id='timestamp'],"
+    " div[data-testid='upvoteRatio'], div[data-click-id='upvote'] span, div._1rZYMD_4xY3gRcSS3p8ODO,"
+    " span[data-testid='comments-page-link-num-comments'], span.FHCV02u6Cp2zYL0fhQPsO"
+)
+_FIELD_NAMES = ("title", "link", "votes", "comments", "timestamp")
+_POINTS_RE = re.compile(r"points?")
+_REDDIT_BASE = "https://www.reddit.com"
+_CAPTCHA_RE = re.compile(r"captcha", re.IGNORECASE)
+
 
 def scrape() -> List[Dict[str, object]]:
     """Return product-like payloads derived from Reddit posts."""
     results: List[Dict[str, object]] = []
-    with selenium_session() as driver:
+    with get_browser_pool().acquire() as driver:
         logger.info("Loading Reddit feed: %s", REDDIT_TRENDING_URL)
         try:
             driver.get(REDDIT_TRENDING_URL)
@@ -32,66 +49,101 @@ def scrape() -> List[Dict[str, object]]:
             logger.warning("Timed out waiting for Reddit content")
             return results
 
+        # Delays only matter between network actions; parsing below is purely local.
         sleep_random()
         page_source = driver.page_source
-        if "captcha" in page_source.lower():
-            logger.warning("Reddit presented a CAPTCHA challenge; skipping run")
-            return results
-
-        soup = BeautifulSoup(page_source, "html.parser")
-        post_nodes = soup.select("div[data-testid='post-container'], div.Post")
-
-        for node in post_nodes[:MAX_PRODUCTS_PER_SOURCE]:
-            info = _parse_post(node)
-            if not info:
-                continue
-            info["platform"] = "Reddit"
-            info["metrics"] = {
-                "votes": info.get("votes"),
-                "comments": info.get("comments"),
-            }
-            results.append(info)
-            sleep_random()
+    if looks_blocked(page_source, _CAPTCHA_RE):
+        logger.warning("Reddit presented a CAPTCHA challenge; skipping run")
+        return results
+
+    root = lxml.html.fromstring(page_source)
+    post_nodes = _POST_SEL(root)
+
+    for node in post_nodes[:MAX_PRODUCTS_PER_SOURCE]:
+        info = _parse_post(node)
+        if not info:
+            continue
+        info["platform"] = "Reddit"
+        info["metrics"] = {
+            "votes": info.get("votes"),
+            "comments": info.get("comments"),
+        }
+        results.append(info)
 
     return results
 
 
+def _post_fields(node) -> Dict[str, object]:
+    """Map each field name to its first matching element under ``node``, in document order."""
+
+    found: Dict[str, object] = {}
+    for element in _FIELDS_SEL(node):
+        tag = element.tag
+        classes = (element.get("class") or "").split()
+        if tag == "h3":
+            found.setdefault("title", element)
+        elif tag == "a":
+            click_id = element.get("data-click-id")
+            if click_id == "body" or element.get("data-testid") == "post-container":
+                found.setdefault("link", element)
+            if click_id == "timestamp":
+                found.setdefault("timestamp", element)
+        elif tag == "div":
+            if element.get("data-testid") == "upvoteRatio" or "_1rZYMD_4xY3gRcSS3p8ODO" in classes:
+                found.setdefault("votes", element)
+        elif tag == "span":
+            if (element.get("data-testid") == "comments-page-link-num-comments"
+                    or "FHCV02u6Cp2zYL0fhQPsO" in classes):
+                found.setdefault("comments", element)
+            if "votes" not in found and _in_upvote_block(element, node):
+                found["votes"] = element
+        if len(found) == len(_FIELD_NAMES):
+            break
+    return found
+
+
+def _in_upvote_block(element, node) -> bool:
+    for ancestor in element.iterancestors():
+        if ancestor.tag == "div" and ancestor.get("data-click-id") == "upvote":
+            return True
+        if ancestor is node:
+            return False
+    return False
+
+
 def _parse_post(node) -> Dict[str, object] | None:
-    title_elem = node.select_one("h3")
-    link_elem = node.select_one("a[data-click-id='body'], a[data-testid='post-container']")
-    if not title_elem or not link_elem:
+    fields = _post_fields(node)
+    title_elem = fields.get("title")
+    link_elem = fields.get("link")
+    if title_elem is None or link_elem is None:
         return None
 
-    name = title_elem.get_text(strip=True)
+    name = node_text(title_elem)
     url = link_elem.get("href")
-    if url and url.startswith("/"):
-        url = f"https://www.reddit.com{url}"
+    if url and url[0] == "/":
+        url = _REDDIT_BASE + url
 
-    votes_elem = node.select_one(
-        "div[data-testid='upvoteRatio'], div[data-click-id='upvote'] span, div._1rZYMD_4xY3gRcSS3p8ODO"
-    )
-    comments_elem = node.select_one(
-        "span[data-testid='comments-page-link-num-comments'], span.FHCV02u6Cp2zYL0fhQPsO"
-    )
-    timestamp_elem = node.select_one("a[data-click-id='timestamp']")
+    votes_elem = fields.get("votes")
+    comments_elem = fields.get("comments")
+    timestamp_elem = fields.get("timestamp")
 
     payload: Dict[str, object] = {
         "name": name,
         "url": url,
     }
 
-    if votes_elem:
-        payload["votes"] = _parse_count(votes_elem.get_text(strip=True))
-    if comments_elem:
-        payload["comments"] = _parse_count(comments_elem.get_text(strip=True).split(" ")[0])
-    if timestamp_elem and payload.get("votes") is not None:
-        payload["description"] = f"Reddit post captured at {timestamp_elem.get_text(strip=True)}"
+    if votes_elem is not None:
+        payload["votes"] = _parse_count(node_text(votes_elem))
+    if comments_elem is not None:
+        payload["comments"] = _parse_count(node_text(comments_elem).split(" ")[0])
+    if timestamp_elem is not None and payload.get("votes") is not None:
+        payload["description"] = f"Reddit post captured at {node_text(timestamp_elem)}"
 
     return payload
 
 
 def _parse_count(text: str) -> int | None:
-    text = text.lower().replace("points", "").replace("point", "").strip()
+    text = _POINTS_RE.sub("", text.lower()).strip()
     if not text:
         return None
     multiplier = 1
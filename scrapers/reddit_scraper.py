@@ -2,17 +2,41 @@
 from __future__ import annotations
 
 import logging
+import random
 from datetime import datetime, timezone
-from typing import Iterable, List
+from typing import Iterable, List, Optional
 
-from bs4 import BeautifulSoup
+import lxml.html
+import requests
 from selenium.webdriver import Chrome
 
-from config import SELECTORS
-from .base_scraper import ProductRecord, SeleniumScraper, safe_int
+from config import SELECTORS, USER_AGENTS
+
+from .base_scraper import (
+    ProductRecord,
+    SeleniumScraper,
+    first_match,
+    first_match_selector,
+    node_text,
+    safe_int,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+# CSS selectors translated to XPath once at import; per-post fields use first-match XPaths.
+_REDDIT_BASE = "https://www.reddit.com"
+_CONFIG = SELECTORS["reddit"]
+_WAIT_SELECTORS = [_CONFIG.product_container]
+_TITLE_SEL = first_match_selector(_CONFIG.name)
+_LINK_SEL = first_match_selector(_CONFIG.link)
+_SUBREDDIT_SEL = first_match_selector(_CONFIG.badges["subreddit"]) if _CONFIG.badges.get("subreddit") else None
+_UPVOTE_SEL = first_match_selector("div[data-click-id='upvote'] span")
+_AGE_SEL = first_match_selector("a[data-click-id='timestamp']")
+
+JSON_TIMEOUT = 10
+# Responses that mean Reddit is refusing the JSON endpoint, so the browser path is needed.
+_BLOCKED_STATUSES = frozenset({403, 429})
+
 
 class RedditRisingScraper(SeleniumScraper):
     platform = "reddit"
@@ -26,47 +50,116 @@ class RedditRisingScraper(SeleniumScraper):
         self.start_urls = tuple(
             f"https://www.reddit.com/r/{subreddit}/rising/" for subreddit in self.subreddits
         )
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = random.choice(USER_AGENTS)
+
+    def fetch(self, urls: Iterable[str] | None = None) -> List[ProductRecord]:
+        """Read each listing from Reddit's JSON endpoint, using the browser only where it is blocked."""
+
+        records: List[ProductRecord] = []
+        blocked = []
+        for url in self.start_urls if urls is None else urls:
+            page = self._fetch_json(url)
+            if page is None:
+                blocked.append(url)
+            else:
+                records.extend(page)
+        if blocked:
+            LOGGER.info("Falling back to the browser for %d Reddit pages", len(blocked))
+            records.extend(super().fetch(urls=blocked))
+        return records
+
+    def _fetch_json(self, url: str) -> Optional[List[ProductRecord]]:
+        """Return records from ``<url>.json``, or None when the endpoint refuses or fails."""
+
+        try:
+            response = self.session.get(f"{url}.json", timeout=JSON_TIMEOUT)
+        except requests.RequestException:
+            LOGGER.warning("Reddit JSON request failed for %s", url, exc_info=True)
+            return None
+        if response.status_code in _BLOCKED_STATUSES:
+            LOGGER.info("Reddit JSON endpoint returned %s for %s", response.status_code, url)
+            return None
+        try:
+            response.raise_for_status()
+            children = response.json()["data"]["children"]
+        except (requests.HTTPError, ValueError, KeyError, TypeError):
+            LOGGER.warning("Unusable Reddit JSON response for %s", url, exc_info=True)
+            return None
+        scraped_at = datetime.now(tz=timezone.utc).isoformat()
+        records: List[ProductRecord] = []
+        for child in children:
+            post = child.get("data") or {}
+            title = post.get("title")
+            if not title:
+                continue
+            upvotes = post.get("ups")
+            if upvotes and upvotes < 100:
+                continue
+            permalink = post.get("permalink")
+            subreddit = post.get("subreddit_name_prefixed")
+            created = post.get("created_utc")
+            records.append(ProductRecord(
+                name=title,
+                url=_REDDIT_BASE + permalink if permalink else url,
+                platform=self.platform,
+                badges=[subreddit] if subreddit else None,
+                reviews=upvotes,
+                metadata={
+                    "source_url": url,
+                    "subreddit": subreddit,
+                    # ``age`` holds the page's relative text ("3 hr. ago"), which the API lacks.
+                    "age": None,
+                    "created_at": (
+                        datetime.fromtimestamp(created, tz=timezone.utc).isoformat() if created else None
+                    ),
+                    "scraped_at": scraped_at,
+                },
+            ))
+        LOGGER.info("Parsed %d posts from Reddit JSON for %s", len(records), url)
+        return records
 
     def parse(self, driver: Chrome, url: str) -> List[ProductRecord]:
-        selector = SELECTORS[self.platform]
-        self.wait_for_any(driver, [selector.product_container])
-        soup = BeautifulSoup(driver.page_source, "html.parser")
+        self.wait_for_any(driver, _WAIT_SELECTORS)
+        # Only the post containers are serialised and parsed, not the surrounding page chrome.
+        posts = lxml.html.fragments_fromstring(self.container_html(driver, _CONFIG.product_container))
         records: List[ProductRecord] = []
-        for post in soup.select(selector.product_container):
-            title_el = post.select_one(selector.name)
-            if not title_el:
+        # One WebDriver round-trip and one timestamp per page rather than per post.
+        source_url = driver.current_url
+        scraped_at = datetime.now(tz=timezone.utc).isoformat()
+        for post in posts:
+            title_el = first_match(_TITLE_SEL, post)
+            if title_el is None:
+                continue
+            # Reject low-traction posts before doing any further lookups or allocations.
+            upvote_el = first_match(_UPVOTE_SEL, post)
+            upvotes = safe_int(node_text(upvote_el, strip=False) if upvote_el is not None else None)
+            if upvotes and upvotes < 100:
                 continue
-            title = title_el.get_text(strip=True)
-            link_el = post.select_one(selector.link)
-            post_url = (
-                f"https://www.reddit.com{link_el['href']}" if link_el and link_el.has_attr("href")
-                else url
-            )
-            subreddit_el = post.select_one(selector.badges.get("subreddit", "")) if selector.badges else None
-            subreddit = subreddit_el.get_text(strip=True) if subreddit_el else None
-            upvote_el = post.select_one("div[data-click-id='upvote'] span")
-            upvotes = safe_int(upvote_el.get_text() if upvote_el else None)
-            age_el = post.select_one("a[data-click-id='timestamp']")
-            age = age_el.get_text(strip=True) if age_el else None
+            title = node_text(title_el)
+            link_el = first_match(_LINK_SEL, post)
+            href = link_el.get("href") if link_el is not None else None
+            post_url = _REDDIT_BASE + href if href is not None else url
+            subreddit_el = first_match(_SUBREDDIT_SEL, post)
+            subreddit = node_text(subreddit_el) if subreddit_el is not None else None
+            age_el = first_match(_AGE_SEL, post)
+            age = node_text(age_el) if age_el is not None else None
 
             metadata = {
-                "source_url": driver.current_url,
+                "source_url": source_url,
                 "subreddit": subreddit,
                 "age": age,
-                "scraped_at": datetime.now(tz=timezone.utc).isoformat(),
+                "scraped_at": scraped_at,
             }
 
-            record = ProductRecord(
+            records.append(ProductRecord(
                 name=title,
                 url=post_url,
                 platform=self.platform,
                 badges=[subreddit] if subreddit else None,
                 reviews=upvotes,
                 metadata=metadata,
-            )
-            if upvotes and upvotes < 100:
-                continue
-            records.append(record)
+            ))
         LOGGER.info("Parsed %d posts from Reddit page", len(records))
         return records
 